@@ -2,11 +2,6 @@
 import click
 import json
 from rbp.config.registry import ModuleRegistry
-from pathlib import Path
-import shutil
-import os
-
-ModuleRegistry.initialize()
 
 def handle_file(file_path):
     click.echo(f"[!] File Output: {file_path}")
@@ -22,15 +17,17 @@ def cli():
 @click.option("--config", default="{}", help="JSON config string")
 def run(module_name, config, file_callback=None):
     """Run a module"""
-    print(f"Running module named '{module_name}")
+    click.echo(f"Running module named '{module_name}'")
+    ModuleRegistry.initialize()
     try:
-        config_dict = json.loads(config)
+        # skip the json parse for the default/empty invocation
+        config_dict = {} if not config or config == "{}" else json.loads(config)
         ModuleRegistry.run_module(
             module_name,
             config_dict,
             file_handler=handle_file
         )
-        click.echo(f"✓ Module Run Completed")
+        click.echo("✓ Module Run Completed")
     except Exception as e:
         click.echo(f"✗ Error: {e}", err=True)
         raise SystemExit(1)
@@ -39,9 +36,10 @@ def run(module_name, config, file_callback=None):
 @cli.command(name="list")
 def list_modules():
     """List installed modules"""
-    for mod in ModuleRegistry.list_modules():
-        source = mod["source"]
-        click.echo(f"{mod['name']} ({source})")
+    ModuleRegistry.initialize()
+    click.echo("\n".join(
+        f"{mod['name']} ({mod['source']})" for mod in ModuleRegistry.list_modules()
+    ))
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
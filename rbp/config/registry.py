@@ -1,23 +1,42 @@
 from typing import Optional
 from rbp.config.settings import settings
+import os
 import sys
 import importlib
 import importlib.util
 import pkgutil
 from tqdm import tqdm
-import inspect
 from pathlib import Path
 
+
+def _cached_import(name):
+    """import_module with a sys.modules fast-path to skip the import lock."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return importlib.import_module(name)
+
+
 class ModuleRegistry:
     BASE_PATH = "rbp.modules.scripts"
     USER_BASE_DIR = Path.home() / ".rbp" / "scripts"
     USER_BASE_DIR.mkdir(parents=True,exist_ok=True)
+    _USER_BASE_DIR_STR = str(USER_BASE_DIR)
     _modules = {}
+    _importers = {}
+    _initialized = False
+    _run_method = None
 
     @classmethod
     def initialize(cls):
+        if cls._initialized:
+            return
+        # resolve once: every module check otherwise goes through the
+        # pydantic settings descriptor
+        cls._run_method = settings.run_method
         cls._load_builtin_modules()
         cls._load_user_modules()
+        cls._initialized = True
     
     @classmethod
     def _register(cls, module):
@@ -25,27 +44,36 @@ class ModuleRegistry:
         cls._modules[name] = module
 
     @classmethod
-    def _load_builtin_modules(cls):
-        pkg = importlib.import_module(cls.BASE_PATH)
-        for _, name, _ in pkgutil.iter_modules(pkg.__path__):
-            mod = importlib.import_module(f"{cls.BASE_PATH}.{name}")
-            if hasattr(mod, settings.run_method):
+    def _scan(cls, search_path, import_prefix=""):
+        """import and register run()-capable modules under one directory"""
+        importer = cls._importers.get(search_path)
+        if importer is None:
+            importer = cls._importers[search_path] = pkgutil.get_importer(search_path)
+        if importer is None:
+            return
+        for name, _ in pkgutil.iter_importer_modules(importer):
+            mod = _cached_import(f"{import_prefix}{name}")
+            if hasattr(mod, cls._run_method):
                 cls._register(mod)
-    
+
+    @classmethod
+    def _load_builtin_modules(cls):
+        pkg = _cached_import(cls.BASE_PATH)
+        for path in pkg.__path__:
+            cls._scan(path, f"{cls.BASE_PATH}.")
+
     @classmethod
     def _load_user_modules(cls):
-        if str(cls.USER_BASE_DIR) not in sys.path:
-            sys.path.insert(0, str(cls.USER_BASE_DIR))
-        
-        for _, name, _ in pkgutil.iter_modules([str(cls.USER_BASE_DIR)]):
-            mod = importlib.import_module(name)
-            if hasattr(mod, settings.run_method):
-                cls._register(mod)
+        if cls._USER_BASE_DIR_STR not in sys.path:
+            sys.path.insert(0, cls._USER_BASE_DIR_STR)
+
+        cls._scan(cls._USER_BASE_DIR_STR)
     
     @classmethod
     def _module_source(cls, module) -> str:
-        module_path = Path(module.__file__).resolve()
-        return "user" if cls.USER_BASE_DIR in module_path.parents else "builtin"
+        module_path = str(Path(module.__file__).resolve())
+        # prefix test instead of materializing and walking .parents
+        return "user" if module_path.startswith(cls._USER_BASE_DIR_STR + os.sep) else "builtin"
 
     @classmethod
     def list_modules(cls):
@@ -67,12 +95,10 @@ class ModuleRegistry:
         """check if module exists"""
         # Built ins
         spec = importlib.util.find_spec(f"{ModuleRegistry.BASE_PATH}.{module_name}")
-        print(f"Base check {spec}")
         if spec:
             return spec
         # USER specified path
-        print(" what is hte problem :" + str(ModuleRegistry.USER_BASE_DIR) + ", " + module_name)
-        spec = importlib.import_module(f"{module_name}")
+        spec = _cached_import(f"{module_name}")
         return spec is not None
     
     @classmethod
@@ -85,15 +111,17 @@ class ModuleRegistry:
                 f"Module '{module_name}' does not exist.\n"
                 f"Available: {','.join(cls._modules)}"
             )
-        if not hasattr(module, settings.run_method):
+        run_method = cls._run_method or settings.run_method
+        if not hasattr(module, run_method):
             raise ValueError(
-                f"Module '{module_name}' missing {settings.run_method} method for RBP to execute."
+                f"Module '{module_name}' missing {run_method} method for RBP to execute."
             )
-        total_steps = 0
-        for _, obj in inspect.getmembers(module, inspect.isfunction):
-            if inspect.getmodule(obj) == module:
-                source = inspect.getsource(obj)
-                total_steps+=source.count("#@rbp_progbar_counter")
+        total_steps = getattr(module, "__rbp_total_steps__", None)
+        if total_steps is None:
+            # one read of the whole source instead of an inspect.getsource
+            # pass (read + tokenize) per function; cached on the module
+            total_steps = Path(module.__file__).read_text().count("#@rbp_progbar_counter")
+            module.__rbp_total_steps__ = total_steps
         
         # run the module and get updates
         with tqdm(total=total_steps, desc=f"Running {module_name}") as pbar:
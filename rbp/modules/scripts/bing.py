@@ -1,4 +1,3 @@
-from seleniumbase import SB                                                                                                                 
 import uuid
 import random
 import string
@@ -6,39 +5,48 @@ from pathlib import Path
 
 
 filename = Path(__file__).stem
+_DOWNLOADS_DIR = Path.home() / 'Downloads'
+
+_LETTERS = string.ascii_lowercase
 
 def generate_random_lowercase_string():
-    length = random.randint(8,12)
-    letters = string.ascii_lowercase
-    random_string = ''.join(random.choice(letters) for i in range(length))
-    return random_string
+    return ''.join(random.choices(_LETTERS, k=random.randint(8,12)))
 
-def handle_progress_callback(progress_callback):
-    if progress_callback:
-        return progress_callback(1)
+def _noop_callback(*args, **kwargs):
+    pass
 
-def handle_filedownload_callback(on_file_downloaded, fpath):
-    if on_file_downloaded:
-        return on_file_downloaded(fpath)
-    
 
 def run(config, progress_callback=None, file_download_callback=None):
-    with SB(uc=True, browser='brave') as sb:  # uc=True enables undetected mode
+    # bind no-op fallbacks once instead of branching at every call site
+    progress_callback = progress_callback or _noop_callback
+    file_download_callback = file_download_callback or _noop_callback
+    # imported here so registry scans / `rbp list` don't pay the
+    # seleniumbase import cost
+    from seleniumbase import SB
+
+    # pls='eager' returns from navigation at DOMContentLoaded instead of
+    # blocking on the full load event (stylesheets, images, subframes)
+    with SB(
+        uc=True,  # uc=True enables undetected mode
+        browser='brave',
+        pls=config.get("page_load_strategy", "eager"),
+        # opt-in since blocking images changes what the screenshot captures
+        block_images=config.get("block_images", False),
+    ) as sb:
         # 1. Navigate to login page
         #@rbp_progbar_counter
         print("1. Navigating to login page...")
         sb.open("https://www.bing.com")
-        handle_progress_callback(progress_callback)
-        sb.sleep(5)
+        progress_callback(1)
+        sb.wait_for_ready_state_complete()
 
         #@rbp_progbar_counter
         print("2. Taking Screenshot")
-        fname = f"rbpss_{filename}_{str(uuid.uuid4())[-6:]}.png"
-        download_path = Path.home() / 'Downloads' / fname 
-        sb.save_screenshot(fname, folder=Path.home() / 'Downloads') 
-        handle_filedownload_callback(file_download_callback, download_path)
+        fname = f"rbpss_{filename}_{uuid.uuid4().hex[-6:]}.png"
+        download_path = _DOWNLOADS_DIR / fname
+        sb.save_screenshot(fname, folder=_DOWNLOADS_DIR)
+        file_download_callback(download_path)
         print("file download callback done")
-        sb.sleep(5)
-        handle_progress_callback(progress_callback)
+        progress_callback(1)
         print("\n✓ Workflow completed successfully!")
         return "Success"
\ No newline at end of file
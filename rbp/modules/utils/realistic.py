@@ -1,77 +1,122 @@
+import asyncio
 import random
 import time
 from typing import Optional
 import string
 
 
-async def sim_alpha_fat_finger(inchar):
-    neighbors = {
-        "q":["w", "a"],
-        "w":["e","d","s","q"],
-        "a":["s","z"],
-        "f":["g","d"],
-        "j":["h","k"],
-        "c":["v"],
-        "n":["m"],
-        "i":["u","o"],
-        "s":["d","a"],
-        "r":["t"],
-        "e":["w","r"],
-        "o":["i","p","l"],
-        "z":["x","s"],
-        "t":["r","g"],
-        "y":["u","t"],
-        "u":["i","y"],
-        "p":["o","l"],
-        "d":['f','s','c'],
-        "g":['f'],
-        "h":['g','j'],
-        "k":['j'],
-        "l":['k'],
-        "m":['n'],
-        "b":['v'],
-        "x":['z','c'],
-        "v":['c','b']
-    }
-    if neighbors.get(str(inchar).lower()):
-        if str(inchar).isupper():
-            return random.choice(neighbors[str(inchar).lower()]).upper()
-        return random.choice(neighbors[inchar])
-    else:
-        if str(inchar).isupper():
-            return random.choice(string.ascii_uppercase)
-        return random.choice(string.ascii_lowercase)
+# built once at import; tuples are cheaper for random.choice than lists
+_NEIGHBORS = {
+    "q":("w","a"),
+    "w":("e","d","s","q"),
+    "a":("s","z"),
+    "f":("g","d"),
+    "j":("h","k"),
+    "c":("v",),
+    "n":("m",),
+    "i":("u","o"),
+    "s":("d","a"),
+    "r":("t",),
+    "e":("w","r"),
+    "o":("i","p","l"),
+    "z":("x","s"),
+    "t":("r","g"),
+    "y":("u","t"),
+    "u":("i","y"),
+    "p":("o","l"),
+    "d":("f","s","c"),
+    "g":("f",),
+    "h":("g","j"),
+    "k":("j",),
+    "l":("k",),
+    "m":("n",),
+    "b":("v",),
+    "x":("z","c"),
+    "v":("c","b"),
+}
 
-async def sim_num_fat_finger(inchar):
+def sim_alpha_fat_finger(inchar):
+    candidates = _NEIGHBORS.get(inchar.lower())
+    if candidates is None:
+        pool = string.ascii_uppercase if inchar.isupper() else string.ascii_lowercase
+        return random.choice(pool)
+    typo = random.choice(candidates)
+    return typo.upper() if inchar.isupper() else typo
+
+def sim_num_fat_finger(inchar):
     return random.choice([str(abs(int(inchar)-1))[-1],str(abs(int(inchar)+1))[-1]])
 
-async def slow_typing(element, text, error_chance=0.06, delay_range=(0.2,0.5),error_delay=(0.1,0.5)):
+async def slow_typing(element, text, error_chance=0.06, delay_range=(0.2,0.5),error_delay=(0.1,0.5), bulk_threshold: Optional[int] = None):
+    """
+    Human-like typing with randomized delays and occasional typos
+
+    Args:
+        element: nodriver element accepting send_keys
+        text: text to type
+        error_chance: per-character probability of a simulated typo
+        delay_range: (lower, upper) seconds between keystrokes
+        error_delay: (lower, upper) seconds before correcting a typo
+        bulk_threshold: when set, only the first N characters are typed
+            realistically and the rest goes out in one send_keys call;
+            0 sends the whole text in a single call for sites where
+            typing cadence doesn't matter
+    """
     print(f"typing: {text}")
-    for char in text:
-        print(f"typing {char}")
-        if random.random()<error_chance:
-            print(f"typo trigger")
+    # optional fast tail: humanize the first bulk_threshold characters,
+    # then push the remainder in one send_keys round-trip instead of one
+    # per character (long textareas, pasted tokens, ...)
+    bulk_tail = ""
+    if bulk_threshold is not None and len(text) > bulk_threshold:
+        text, bulk_tail = text[:bulk_threshold], text[bulk_threshold:]
+    # draw the whole typo/delay schedule up front so the typing loop does
+    # no random attribute lookups or branches beyond the plan itself
+    rand = random.random
+    uniform = random.uniform
+    typos = [rand() < error_chance for _ in text]
+    delays = [uniform(*delay_range) for _ in text]
+    err_delays = [uniform(*error_delay) for _ in text]
+    for char, typo, delay, err_delay in zip(text, typos, delays, err_delays):
+        if typo:
             if char.isalpha():
-                await element.send_keys(sim_alpha_fat_finger(char))
-                time.sleep(random.uniform(*error_delay))
-                await element.send_keys('\b')
-                time.sleep(random.uniform(*delay_range))
+                typo_char = sim_alpha_fat_finger(char)
             elif char.isdigit():
-                await element.send_keys(sim_num_fat_finger(char))
-                time.sleep(random.uniform(*error_delay))
-                await element.send_keys('\b')
-                time.sleep(random.uniform(*delay_range))
+                typo_char = sim_num_fat_finger(char)
             else:
                 continue
+            await element.send_keys(typo_char)
+            await asyncio.sleep(err_delay)
+            await element.send_keys('\b')
+            await asyncio.sleep(delay)
         await element.send_keys(char)
-        time.sleep(random.uniform(*delay_range))
+        await asyncio.sleep(delay)
+    if bulk_tail:
+        await element.send_keys(bulk_tail)
+
+# None until a pause has actually ended, so the first call always sleeps
+# its full drawn wait instead of crediting time since process start
+_last_pause_end = None
 
 async def random_pause(lower: float = 0.2, upper: float = 4.0):
     """
     Simple random pause utility
-    
+
+    Time already spent since the previous pause ended counts toward the
+    drawn wait, so back-to-back calls (e.g. post-click then pre-scroll)
+    coalesce instead of stacking full-length sleeps.
+
+    Note: the last-pause timestamp is module-level state shared by every
+    coroutine in the process, so the coalescing assumes one bot per
+    process. Concurrent bots in one event loop would credit each other's
+    elapsed time and under-sleep.
+
     Args:
         lower: Minimum wait time (seconds)
         upper: Maximum wait time (seconds)
     """
-    time.sleep(random.uniform(lower, upper))
\ No newline at end of file
+    global _last_pause_end
+    wait = random.uniform(lower, upper)
+    if _last_pause_end is not None:
+        wait -= max(0.0, time.monotonic() - _last_pause_end)
+    if wait > 0:
+        await asyncio.sleep(wait)
+    _last_pause_end = time.monotonic()
\ No newline at end of file